@@ -65,10 +65,12 @@ class Box:
         """
         sel = X > min_value
         if sel.any():
-            nonzero = np.where(sel)
             bounds = []
             for dim in range(len(X.shape)):
-                bounds.append((nonzero[dim].min(), nonzero[dim].max() + 1))
+                # project selection onto dim instead of listing all selected indices
+                axes = tuple(d for d in range(len(X.shape)) if d != dim)
+                nonzero = np.flatnonzero(sel.any(axis=axes))
+                bounds.append((nonzero[0], nonzero[-1] + 1))
         else:
             bounds = [[0, 0]] * len(X.shape)
         return Box.from_bounds(*bounds)
@@ -113,24 +113,31 @@ class Blend(CombinedComponent):
         grad_logL = lambda *X: expand_grads(*X, func=grad_logL_func)
 
         # same for prior. easier her bc we call them independently
-        grad_logP = lambda *X: tuple(
-            x.prior(x.view(np.ndarray)) if x.prior is not None and not x.fixed else 0
-            for x in X
-        )
+        # only non-fixed parameters with a prior need to be evaluated
+        require_prior = tuple(k for k in require_grad if X[k].prior is not None)
+
+        def grad_logP(*X):
+            expanded = [0] * len(X)
+            for k in require_prior:
+                expanded[k] = X[k].prior(X[k].view(np.ndarray))
+            return expanded
 
         # combine for log posterior
         _grad = lambda *X: tuple(l + p for l, p in zip(grad_logL(*X), grad_logP(*X)))
 
         # step sizes, allow for random skipping of parameters
+        # resolve step attributes once instead of in every iteration
+        # fixed parameters are not updated: no step size or constraint needed
+        steps = tuple((0, False) if x.fixed else (x.step, callable(x.step)) for x in X)
         _step = lambda *X, it: tuple(
             1e-20
-            if np.random.rand() < random_skip
-            else x.step(x, it=it)
-            if hasattr(x.step, "__call__")
-            else x.step
-            for x in X
+            if random_skip > 0 and np.random.rand() < random_skip
+            else step(x, it=it)
+            if is_callable
+            else step
+            for x, (step, is_callable) in zip(X, steps)
         )
-        _prox = tuple(x.constraint for x in X)
+        _prox = tuple(None if x.fixed else x.constraint for x in X)
 
         # good defaults for adaprox
         scheme = alg_kwargs.pop("scheme", "amsgrad")
@@ -175,7 +182,8 @@ class Blend(CombinedComponent):
             p.m = m
             p.v = v
             p.vhat = vhat
-            p.std = 1 / np.sqrt(ma.masked_equal(v, 0))  # this is rough estimate!
+            # this is rough estimate!
+            p.std = (1 / np.sqrt(ma.masked_equal(v, 0))).astype(p.dtype)
 
         return len(self.log_likelihood), self.log_likelihood[-1]
 
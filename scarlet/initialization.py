@@ -14,6 +14,15 @@ from . import measure
 logger = logging.getLogger("scarlet.initialisation")
 
 
+def _get_reference_observation(observations):
+    """Find the first `Observation` that lives in the same plane as the model frame
+    """
+    obs_ref = next((obs for obs in observations if type(obs) is Observation), None)
+    if obs_ref is None:
+        raise ValueError("no Observation in the same frame as the model")
+    return obs_ref
+
+
 def get_best_fit_spectra(morphs, images):
     """Calculate best fitting spectra for multiple components.
 
@@ -44,7 +53,8 @@ def get_best_fit_spectra(morphs, images):
         images_ = np.stack(tuple(obs.images for obs in images), axis=0)
 
     data = images_.reshape(images_.shape[0], -1)
-    seds = np.dot(np.linalg.inv(np.dot(_morph, _morph.T)), np.dot(_morph, data.T))
+    # solve the normal equations without forming the inverse
+    seds = np.linalg.solve(np.dot(_morph, _morph.T), np.dot(_morph, data.T))
     return seds
 
 
@@ -72,31 +82,34 @@ def get_pixel_spectrum(sky_coord, observations, correct_psf=False):
     if not hasattr(observations, "__iter__"):
         observations = (observations,)
 
-    spectra = []
+    # fill the channels of each observation directly into the full spectrum
+    C = sum(obs.frame.C for obs in observations)
+    dtype = np.result_type(*(obs.images.dtype for obs in observations))
+    spectrum = np.empty(C, dtype=dtype)
+    start = 0
     for obs in observations:
+        stop = start + obs.frame.C
         pixel = obs.frame.get_pixel(sky_coord)
         index = np.round(pixel).astype(np.int)
-        spectrum = obs.images[:, index[0], index[1]].copy()
+        spectrum[start:stop] = obs.images[:, index[0], index[1]]
 
         if obs.frame.psf is not None and correct_psf:
             # image of point source in observed = obs.frame.psf
-            psf_model = obs.frame.psf.get_model()
-            psf_center = psf_model.max(axis=(1, 2))
+            psf_center = obs.frame.psf.peaks
             # best fit solution for the model amplitude of the center pixel
             # to yield to PSF center: (spectrum * psf_center) / psf_center**2
             # or shorter:
-            spectrum /= psf_center
-
-        spectra.append(spectrum)
+            spectrum[start:stop] /= psf_center
 
-    spectrum = np.concatenate(spectra).reshape(-1)
+        start = stop
 
-    if np.any(spectrum <= 0):
+    n_bad = np.count_nonzero(spectrum <= 0)
+    if n_bad:
         # If the flux in all channels is  <=0,
         # the new sed will be filled with NaN values,
         # which will cause the code to crash later
         msg = "Zero or negative spectrum {} at y={}, x={}".format(spectrum, *sky_coord)
-        if np.all(spectrum <= 0):
+        if n_bad == spectrum.size:
             logger.warning(msg)
         else:
             logger.info(msg)
@@ -129,9 +142,11 @@ def get_psf_spectrum(sky_coord, observations):
     if not hasattr(observations, "__iter__"):
         observations = (observations,)
 
-    spectra = []
+    # fill the channels of each observation directly into the full spectrum
+    spectrum = np.empty(sum(obs.frame.C for obs in observations))
+    start = 0
     for obs in observations:
-
+        stop = start + obs.frame.C
         pixel = obs.frame.get_pixel(sky_coord)
         index = np.round(pixel).astype(np.int)
 
@@ -147,17 +162,16 @@ def get_psf_spectrum(sky_coord, observations):
 
         # amplitude of img when projected onto psf
         # i.e. factor to multiply psf with to get img (if img looked like psf)
-        spectrum = (img * psf).sum(axis=1) / (psf * psf).sum(axis=1)
-        spectra.append(spectrum)
-
-    spectrum = np.concatenate(spectra).reshape(-1)
+        spectrum[start:stop] = (img * psf).sum(axis=1) / (psf * psf).sum(axis=1)
+        start = stop
 
-    if np.any(spectrum <= 0):
+    n_bad = np.count_nonzero(spectrum <= 0)
+    if n_bad:
         # If the flux in all channels is  <=0,
         # the new sed will be filled with NaN values,
         # which will cause the code to crash later
         msg = "Zero or negative spectrum {} at y={}, x={}".format(spectrum, *sky_coord)
-        if np.all(spectrum <= 0):
+        if n_bad == spectrum.size:
             logger.warning(msg)
         else:
             logger.info(msg)
@@ -173,11 +187,8 @@ def get_minimal_boxsize(size, min_size=15, increment=8):
 
 
 def trim_morphology(center_index, morph, bg_thresh=0):
-    # trim morph to pixels above threshold
-    mask = morph > bg_thresh
-    morph[~mask] = 0
-
-    bbox = Box.from_data(morph, min_value=0)
+    # bounds of the pixels above threshold
+    bbox = Box.from_data(morph, min_value=bg_thresh)
 
     # find fitting bbox
     if bbox.contains(center_index):
@@ -199,7 +210,10 @@ def trim_morphology(center_index, morph, bg_thresh=0):
     left = center_index[1] - boxsize // 2
     right = center_index[1] + boxsize // 2
     bbox = Box.from_bounds((bottom, top), (left, right))
-    morph = bbox.extract_from(morph)
+    morph = bbox.extract_from(morph, sub=np.zeros(bbox.shape, dtype=morph.dtype))
+
+    # trim morph to pixels above threshold, only needed inside of the new box
+    morph[~(morph > bg_thresh)] = 0
     return morph, bbox
 
 
@@ -372,6 +386,37 @@ def init_extended_source(
     return spectrum, morph, bbox
 
 
+def get_wavelet_noise(observation):
+    """Noise level of the first starlet scale, propagated through the difference kernels
+
+    The result is cached in `observation` and reused as long as neither its images
+    nor its difference kernels are replaced.
+
+    Parameters
+    ----------
+    observation: `~scarlet.Observation`
+        Observation to measure the noise of
+
+    Returns
+    -------
+    noise: array
+        Noise level in each channel of `observation`
+    """
+    images, diff_kernels = observation.images, observation._diff_kernels
+    try:
+        images_, diff_kernels_, noise = observation._wavelet_noise
+        if images_ is images and diff_kernels_ is diff_kernels:
+            return noise
+    except AttributeError:
+        pass
+
+    noise = mad_wavelet(images) * np.sqrt(
+        np.sum(diff_kernels.image ** 2, axis=(-2, -1))
+    )
+    observation._wavelet_noise = (images, diff_kernels, noise)
+    return noise
+
+
 def init_starlet_source(
     sky_coord,
     model_frame,
@@ -401,13 +446,12 @@ def init_starlet_source(
         min_grad=min_grad,
     )
 
-    noise = []
+    noise = np.empty(len(sed))
+    start = 0
     for obs in observations:
-        noise += [
-            mad_wavelet(obs.images)
-            * np.sqrt(np.sum(obs._diff_kernels.image ** 2, axis=(-2, -1)))
-        ]
-    noise = np.concatenate(noise)
+        stop = start + obs.frame.C
+        noise[start:stop] = get_wavelet_noise(obs)
+        start = stop
 
     # Threshold in units of noise on the coadd
     thresh = starlet_thresh * np.sqrt(np.sum((sed * noise) ** 2))
@@ -440,9 +484,8 @@ def init_multicomponent_source(
             obs_ref = observations[0]
         else:
             # The observation that lives in the same plane as the frame
-            loc = np.where([type(obs) is Observation for obs in observations])
             # If more than one element is an `Observation`, then pick the first one as a reference (arbitrary)
-            obs_ref = observations[loc[0]]
+            obs_ref = _get_reference_observation(observations)
 
     if flux_percentiles is None:
         flux_percentiles = [25]
@@ -463,40 +506,39 @@ def init_multicomponent_source(
     # each other so that they sum up to morph
     K = len(flux_percentiles) + 1
 
-    Ny, Nx = morph.shape
-    morphs = np.zeros((K, Ny, Nx), dtype=morph.dtype)
-    morphs[0, :, :] = morph[:, :]
     max_flux = morph.max()
-    percentiles_ = np.sort(flux_percentiles)
-    last_thresh = 0
-    for k in range(1, K):
-        perc = percentiles_[k - 1]
-        flux_thresh = perc * max_flux / 100
-        mask_ = morph > flux_thresh
-        morphs[k - 1][mask_] = flux_thresh - last_thresh
-        morphs[k][mask_] = morph[mask_] - flux_thresh
-        last_thresh = flux_thresh
+    # component k holds the flux between the thresholds k and k+1
+    thresholds = np.zeros(K, dtype=morph.dtype)
+    thresholds[1:] = sorted(flux_percentiles)
+    thresholds *= max_flux
+    thresholds /= 100
+    heights = np.append(np.diff(thresholds), np.inf).astype(morph.dtype)
+    morphs = np.clip(
+        morph[None, :, :] - thresholds[:, None, None], 0, heights[:, None, None]
+    )
+    # the lowest component retains the entire footprint of morph
+    morphs[0] = np.minimum(morph, heights[0])
 
     # renormalize morphs: initially Smax
-    for k in range(K):
-        if np.all(morphs[k] <= 0):
-            msg = "Zero or negative morphology for component {} at y={}, x={}"
-            logger.warning(msg.format(k, *sky_coord))
-        morphs[k] /= morphs[k].max()
+    maxes = morphs.reshape(K, -1).max(axis=1)
+    bad = maxes <= 0
+    for k in np.flatnonzero(bad):
+        msg = "Zero or negative morphology for component {} at y={}, x={}"
+        logger.warning(msg.format(k, *sky_coord))
+    morphs /= np.where(bad, 1, maxes)[:, None, None]
 
     # optimal SEDs given the morphologies, assuming img only has that source
     boxed_img = bbox.extract_from(obs_ref.images)
     spectra = get_best_fit_spectra(morphs, boxed_img)
 
-    for k in range(K):
-        if np.all(spectra[k] <= 0):
-            # If the flux in all channels is  <=0,
-            # the new sed will be filled with NaN values,
-            # which will cause the code to crash later
-            msg = "Zero or negative spectrum {} for component {} at y={}, x={}".format(
-                spectra[k], k, *sky_coord
-            )
-            logger.warning(msg)
+    for k in np.flatnonzero(np.all(spectra <= 0, axis=1)):
+        # If the flux in all channels is  <=0,
+        # the new sed will be filled with NaN values,
+        # which will cause the code to crash later
+        msg = "Zero or negative spectrum {} for component {} at y={}, x={}".format(
+            spectra[k], k, *sky_coord
+        )
+        logger.warning(msg)
 
     # avoid using the same box for multiple components
     boxes = tuple(bbox.copy() for k in range(K))
@@ -532,7 +574,8 @@ def build_sed_coadd(seds, bg_rmses, observations, obs_ref=None):
     Returns
     -------
     detect: array
-        2D image created by weighting all of the channels by SED
+        2D image created by weighting all of the channels by SED,
+        with the dtype of the frame of `obs_ref`
     bg_cutoff: float
         The minimum value in `detect` to include in detection.
     """
@@ -546,8 +589,7 @@ def build_sed_coadd(seds, bg_rmses, observations, obs_ref=None):
 
     # The observation that lives in the same plane as the frame
     if obs_ref is None:
-        loc = np.where([type(obs) is Observation for obs in observations])
-        obs_ref = observations[np.int(loc[0])]
+        obs_ref = _get_reference_observation(observations)
     else:
         # The observation that lives in the same plane as the frame
         assert type(obs_ref) is not LowResObservation, (
@@ -555,44 +597,39 @@ def build_sed_coadd(seds, bg_rmses, observations, obs_ref=None):
             f"provided refers to an observation of type: {type(obs_ref)}"
         )
 
-    positive_img = []
-    positive_bgrms = []
-    weights = []
-    jacobian_args = []
+    # accumulate the weighted channels directly into the coadd,
+    # in the precision of the reference frame
+    detect = np.zeros(obs_ref.frame.shape[-2:], dtype=obs_ref.frame.dtype)
+    weights_bgrms = 0
+    jacobian = 0
     for i, obs in enumerate(observations):
-        sed = seds[i]
-        try:
-            iter(sed)
-        except TypeError:
-            sed = [sed]
+        # convert once, scalars are treated as single channels
+        sed = np.atleast_1d(seds[i])
         C = len(sed)
-        bg_rms = bg_rmses[i]
-        try:
-            iter(bg_rms)
-        except TypeError:
-            bg_rms = [bg_rms]
-        if np.any(np.array(bg_rms) <= 0):
+        bg_rms = np.atleast_1d(bg_rmses[i])
+        if np.any(bg_rms <= 0):
             raise ValueError("bg_rms must be greater than zero in all channels")
-
-        positive = [c for c in range(C) if sed[c] > 0]
-        if type(obs) is not LowResObservation:
-            positive_img += [obs.images[c] for c in positive]
-        else:
-            positive_img += [
-                interpolate_observation(obs, obs_ref.frame)[c] for c in positive
-            ]
-        positive_bgrms += [bg_rms[c] for c in positive]
-        weights += [sed[c] / bg_rms[c] ** 2 for c in positive]
-        jacobian_args += [sed[c] ** 2 / bg_rms[c] ** 2 for c in positive]
-
-    detect = np.einsum("i,i...", np.array(weights), positive_img) / np.sum(
-        jacobian_args
-    )
+        bg_var = bg_rms ** 2
+
+        images = obs.images if type(obs) is not LowResObservation else None
+        for c in range(C):
+            # only positive channels contribute
+            if not sed[c] > 0:
+                continue
+            if images is None:
+                # interpolate all channels at once
+                images = interpolate_observation(obs, obs_ref.frame)
+            weight = sed[c] / bg_var[c]
+            detect += weight * images[c]
+            weights_bgrms += weight ** 2 * bg_var[c]
+            jacobian += sed[c] ** 2 / bg_var[c]
+
+    if jacobian == 0:
+        raise ValueError("sed must be greater than zero in at least one channel")
+    detect /= jacobian
 
     # thresh is multiple above the rms of detect (weighted variance across channels)
-    bg_cutoff = np.sqrt(
-        (np.array(weights) ** 2 * np.array(positive_bgrms) ** 2).sum()
-    ) / np.sum(jacobian_args)
+    bg_cutoff = np.sqrt(weights_bgrms) / jacobian
     return detect, bg_cutoff
 
 
@@ -624,8 +661,7 @@ def build_initialization_coadd(observations, filtered_coadd=False, obs_idx=None)
         observations = [observations]
 
     if obs_idx is None:
-        loc = np.where([type(obs) is Observation for obs in observations])
-        obs_ref = observations[loc[0][0]]
+        obs_ref = _get_reference_observation(observations)
     else:
         # The observation that lives in the same plane as the frame
         assert type(observations[obs_idx]) is Observation, (
@@ -122,6 +122,8 @@ class PointSourceMorphology(Morphology):
         pixel_center = tuple(np.round(center).astype("int"))
         shift = (0, *pixel_center)
         bbox = self.psf.bbox + shift
+        # constant reference for the offset of center
+        self._box_center = np.mean(bbox.bounds[1:], axis=1)
 
         # parameters is simply 2D center
         if isinstance(center, Parameter):
@@ -134,8 +136,7 @@ class PointSourceMorphology(Morphology):
 
     def get_model(self, *parameters):
         center = self.get_parameter(0, *parameters)
-        box_center = np.mean(self.bbox.bounds[1:], axis=1)
-        offset = center - box_center
+        offset = center - self._box_center
         return self.psf.get_model(offset=offset)  # no "internal" PSF parameters here
 
 
@@ -170,13 +171,10 @@ class StarletMorphology(Morphology):
         coeffs = self.transform.coefficients
         # wavelet-scale norm
         starlet_norm = self.transform.norm
-        # One threshold per wavelet scale: thresh*norm
-        thresh_array = np.zeros(coeffs.shape) + threshold
-        thresh_array = (
-            thresh_array * np.array([starlet_norm])[..., np.newaxis, np.newaxis]
-        )
+        # One threshold per wavelet scale: thresh*norm, broadcast over pixels
+        thresh_array = threshold * np.array([starlet_norm])[..., np.newaxis, np.newaxis]
         # We don't threshold the last scale
-        thresh_array[:, -1, :, :] = 0
+        thresh_array[:, -1] = 0
 
         constraint = ConstraintChain(L0Constraint(thresh_array), PositivityConstraint())
 
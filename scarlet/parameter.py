@@ -1,4 +1,6 @@
-import autograd.numpy as np
+import numbers
+
+import numpy as np
 from autograd.numpy.numpy_boxes import ArrayBox
 from autograd.core import VSpace
 
@@ -21,6 +23,7 @@ class Parameter(np.ndarray):
         Constraint on parameter
     step: float or method
         The step size for the parameter
+        Numerical step sizes are stored with the dtype of the parameter.
         If a method is used, it needs to have the signature
             `step(X, it) -> float`
         where `X` is the parameter value and `it` the iteration counter
@@ -39,6 +42,19 @@ class Parameter(np.ndarray):
         Whether parameter is held fixed (excluded) during optimization
     """
 
+    __slots__ = (
+        "name",
+        "prior",
+        "constraint",
+        "step",
+        "std",
+        "m",
+        "v",
+        "vhat",
+        "fixed",
+        "_data_cache",
+    )
+
     def __new__(
         cls,
         array,
@@ -52,7 +68,14 @@ class Parameter(np.ndarray):
         vhat=None,
         fixed=False,
     ):
-        obj = np.asarray(array, dtype=array.dtype).view(cls)
+        if isinstance(array, np.ndarray):
+            obj = array.view(cls)
+        else:
+            array = np.asarray(array)
+            obj = array.view(cls)
+        if type(array) is np.ndarray:
+            # plain array with the same memory layout: use it as `_data`
+            obj._data_cache = array
         obj.name = name
         if prior is not None:
             assert isinstance(prior, Prior)
@@ -62,6 +85,13 @@ class Parameter(np.ndarray):
                 constraint, ConstraintChain
             )
         obj.constraint = constraint
+        if np.issubdtype(obj.dtype, np.floating):
+            # same precision as the parameter: no type promotion during updates
+            # other types of step, e.g. methods, are left untouched
+            if isinstance(step, numbers.Real):
+                step = obj.dtype.type(step)
+            elif isinstance(step, (np.ndarray, list, tuple)):
+                step = np.asarray(step, dtype=obj.dtype)
         obj.step = step
         obj.std = std
         obj.m = m
@@ -73,32 +103,95 @@ class Parameter(np.ndarray):
     def __array_finalize__(self, obj):
         if obj is None:
             return
-        self.name = getattr(obj, "name", "unnamed")
-        self.prior = getattr(obj, "prior", None)
-        self.constraint = getattr(obj, "constraint", None)
-        self.step = getattr(obj, "step", 0)
-        self.std = getattr(obj, "std", None)
-        self.m = getattr(obj, "m", None)
-        self.v = getattr(obj, "v", None)
-        self.vhat = getattr(obj, "vhat", None)
-        self.fixed = getattr(obj, "fixed", False)
+        if isinstance(obj, Parameter):
+            # views of a Parameter: copy metadata without fallback lookups
+            self.name = obj.name
+            self.prior = obj.prior
+            self.constraint = obj.constraint
+            self.step = obj.step
+            self.std = obj.std
+            self.m = obj.m
+            self.v = obj.v
+            self.vhat = obj.vhat
+            self.fixed = obj.fixed
+            return
+        # plain arrays carry no metadata: set the defaults of `__new__`
+        self.name = "unnamed"
+        self.prior = None
+        self.constraint = None
+        self.step = 0
+        self.std = None
+        self.m = None
+        self.v = None
+        self.vhat = None
+        self.fixed = False
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # results of arithmetic with a Parameter are plain arrays:
+        # this avoids `__array_finalize__` on every temporary, e.g. during autograd
+        inputs = tuple(x._data if isinstance(x, Parameter) else x for x in inputs)
+        out = kwargs.get("out", None)
+        if out is not None:
+            kwargs["out"] = tuple(
+                x._data if isinstance(x, Parameter) else x for x in out
+            )
+        result = getattr(ufunc, method)(*inputs, **kwargs)
+        # in-place operations need to return the Parameter itself
+        if out is not None:
+            if len(out) == 1:
+                return out[0]
+            # outputs not provided in `out` are allocated by numpy
+            return tuple(r if o is None else o for o, r in zip(out, result))
+        return result
 
     def __reduce__(self):
         # Get the parent's __reduce__ tuple
         pickled_state = super().__reduce__()
-        # Create our own tuple to pass to __setstate__, but append the __dict__ rather than individual members.
-        new_state = pickled_state[2] + (self.__dict__,)
+        # Create our own tuple to pass to __setstate__, with the metadata in slot order
+        meta = (
+            self.name,
+            self.prior,
+            self.constraint,
+            self.step,
+            self.std,
+            self.m,
+            self.v,
+            self.vhat,
+            self.fixed,
+        )
+        new_state = pickled_state[2] + (meta,)
         # Return a tuple that replaces the parent's __setstate__ tuple with our own
         return (pickled_state[0], pickled_state[1], new_state)
 
     def __setstate__(self, state):
-        self.__dict__.update(state[-1])  # Update the internal dict from state
+        meta = state[-1]
+        if isinstance(meta, dict):
+            # older pickles stored the instance __dict__
+            meta = tuple(meta[k] for k in self.__slots__ if k != "_data_cache")
+        (
+            self.name,
+            self.prior,
+            self.constraint,
+            self.step,
+            self.std,
+            self.m,
+            self.v,
+            self.vhat,
+            self.fixed,
+        ) = meta
         # Call the parent's __setstate__ with the other tuple elements.
         super().__setstate__(state[0:-1])
+        # memory has been replaced
+        self._data_cache = self.view(np.ndarray)
 
     @property
     def _data(self):
-        return self.view(np.ndarray)
+        # view as plain array is created once and shares memory with self
+        try:
+            return self._data_cache
+        except AttributeError:
+            self._data_cache = self.view(np.ndarray)
+            return self._data_cache
 
     @property
     def is_finite(self):
@@ -116,4 +209,10 @@ VSpace.register(Parameter, vspace_maker=VSpace.mappings[np.ndarray])
 def relative_step(X, it, factor=0.1, axis=None):
     """Step size set at `factor` times the mean of `X` in direction `axis`
     """
-    return factor * X.mean(axis=axis)
+    if isinstance(X, Parameter):
+        X = X._data
+    step = factor * X.mean(axis=axis)
+    # same precision as a floating-point parameter
+    if np.issubdtype(X.dtype, np.floating):
+        step = step.astype(X.dtype, copy=False)
+    return step
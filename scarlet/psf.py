@@ -11,7 +11,8 @@ def normalize(image):
     """
     sums = image.sum(axis=(1, 2))
     if isinstance(image, Parameter):
-        image._data /= sums[:, None, None]
+        # in place in the memory of the parameter: `_data` cannot be reassigned
+        image._data[:] /= sums[:, None, None]
     else:
         image /= sums[:, None, None]
     return image
@@ -35,6 +36,23 @@ class PSF(Model):
         """
         pass
 
+    @property
+    def peaks(self):
+        """Peak value of the centered PSF model in every channel
+
+        The result is cached as read-only array if all parameters of the PSF are
+        fixed. In-place changes of fixed parameters are not detected, i.e. the
+        cached peaks are not updated.
+        """
+        if not all(p.fixed for p in self.parameters):
+            return self.get_model().max(axis=(1, 2))
+        try:
+            return self._peaks
+        except AttributeError:
+            self._peaks = self.get_model().max(axis=(1, 2))
+            self._peaks.flags.writeable = False
+            return self._peaks
+
     def prepare_param(self, X, name):
         if isinstance(X, Parameter):
             assert X.name == name
@@ -4,6 +4,7 @@ from functools import partial
 from .component import CombinedComponent, FactorizedComponent
 from .constraint import PositivityConstraint
 from .initialization import (
+    get_best_fit_spectra,
     get_pixel_spectrum,
     get_psf_spectrum,
     init_compact_source,
@@ -29,7 +30,7 @@ class RandomSource(FactorizedComponent):
     observation.
     """
 
-    def __init__(self, model_frame, observations=None):
+    def __init__(self, model_frame, observations=None, rng=None):
         """Source intialized as random field.
 
         Parameters
@@ -38,13 +39,21 @@ class RandomSource(FactorizedComponent):
             The frame of the model
         observations: instance or list of `~scarlet.Observation`
             Observation to initialize the SED of the source
+        rng: `numpy.random.Generator`
+            Random number generator. If not set, a new default generator is used,
+            which is not affected by `numpy.random.seed`.
         """
+        if rng is None:
+            rng = np.random.default_rng()
+        # Generator.random only draws float32 or float64 values
+        dtype = np.dtype(model_frame.dtype)
+        draw_dtype = dtype if dtype in (np.float32, np.float64) else np.float64
         C, Ny, Nx = model_frame.bbox.shape
-        image = np.random.rand(Ny, Nx)
-        morphology = ImageMorphology(image)
+        image = rng.random((Ny, Nx), dtype=draw_dtype).astype(dtype, copy=False)
+        morphology = ImageMorphology(model_frame, image)
 
         if observations is None:
-            spectrum = np.random.rand(C)
+            spectrum = rng.random(C, dtype=draw_dtype).astype(dtype, copy=False)
         else:
             spectrum = get_best_fit_spectra(image[None], observations)[0]
 
@@ -55,7 +64,7 @@ class RandomSource(FactorizedComponent):
             step=partial(relative_step, factor=1e-1),
             constraint=PositivityConstraint(),
         )
-        spectrum = TabulatedSpectrum(spectrum)
+        spectrum = TabulatedSpectrum(model_frame, spectrum)
 
         super().__init__(model_frame, spectrum, morphology)
 
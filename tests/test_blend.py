@@ -0,0 +1,63 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+
+import scarlet
+
+
+class CountingPrior(scarlet.Prior):
+    """Flat prior that records its evaluations"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, X):
+        self.calls += 1
+        return np.zeros(X.shape, dtype=X.dtype)
+
+    def grad(self, X):
+        return self(X)
+
+
+class TestBlend:
+    def test_fit(self):
+        shape = (2, 9, 9)
+        channels = np.arange(shape[0])
+        frame = scarlet.Frame(shape, channels=channels, dtype=np.float64)
+        images = np.zeros(shape)
+        images[:, 3:6, 3:6] = np.array([1.0, 2.0])[:, None, None]
+        observation = scarlet.Observation(images, channels=channels).match(frame)
+
+        # fixed parameter whose initial values violate its constraint
+        sed = np.array([-1.0, 2.0])
+        spectrum = scarlet.Parameter(
+            sed.copy(),
+            name="spectrum",
+            step=0.1,
+            constraint=scarlet.PositivityConstraint(),
+            fixed=True,
+        )
+
+        # free parameter with callable step and prior
+        iterations = []
+
+        def step(X, it):
+            iterations.append(it)
+            return 0.1
+
+        prior = CountingPrior()
+        morph = np.full(shape[1:], 0.5)
+        image = scarlet.Parameter(morph.copy(), name="image", step=step, prior=prior)
+
+        source = scarlet.FactorizedComponent(
+            frame,
+            scarlet.TabulatedSpectrum(frame, spectrum),
+            scarlet.ImageMorphology(frame, image),
+        )
+        blend = scarlet.Blend([source], observation)
+        it, logL = blend.fit(max_iter=5, e_rel=0)
+
+        assert it == 5
+        assert_array_equal(spectrum, sed)
+        assert iterations == list(range(5))
+        assert prior.calls == 5
+        assert np.any(image != morph)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from astropy.wcs import WCS
+
+import scarlet
+from scarlet.initialization import build_sed_coadd, get_wavelet_noise
+from scarlet.wavelet import mad_wavelet
+
+
+class TestInitialization(object):
+    def get_psf(self, sigma, shape=(2, 11, 11)):
+        y, x = np.indices(shape[1:]) - shape[1] // 2
+        image = np.exp(-(x ** 2 + y ** 2) / (2 * sigma ** 2))
+        return scarlet.ImagePSF(np.repeat(image[None], shape[0], axis=0))
+
+    def get_observation(self, shape=(2, 31, 31)):
+        channels = ["c{}".format(c) for c in range(shape[0])]
+        model_frame = scarlet.Frame(shape, psfs=self.get_psf(0.7), channels=channels)
+        images = np.random.RandomState(0).normal(size=shape)
+        observation = scarlet.Observation(
+            images, psfs=self.get_psf(1.5), channels=channels
+        )
+        return observation.match(model_frame), model_frame
+
+    def get_lowres_observation(self, shape=(2, 11, 11)):
+        psf = scarlet.ImagePSF(np.ones((shape[0], 5, 5)))
+        channels = ["lr{}".format(c) for c in range(shape[0])]
+        return scarlet.LowResObservation(
+            np.ones(shape), channels=channels, wcs=WCS(naxis=2), psfs=psf
+        )
+
+    def test_missing_reference(self):
+        # only LowResObservations: no observation in the plane of the model
+        observations = [self.get_lowres_observation() for i in range(2)]
+        seds = [np.ones(2)] * 2
+        bg_rmses = [np.ones(2)] * 2
+        with pytest.raises(ValueError):
+            build_sed_coadd(seds, bg_rmses, observations)
+
+    def test_wavelet_noise(self):
+        observation, model_frame = self.get_observation()
+        noise = get_wavelet_noise(observation)
+        kernels = observation._diff_kernels.image
+        expected = mad_wavelet(observation.images) * np.sqrt(
+            np.sum(kernels ** 2, axis=(-2, -1))
+        )
+        assert_allclose(noise, expected)
+
+        # reused as long as images and difference kernels are the same
+        assert get_wavelet_noise(observation) is noise
+
+        # recomputed for new images
+        observation.images = 2 * observation.images
+        noise_ = get_wavelet_noise(observation)
+        assert noise_ is not noise
+        assert_allclose(noise_, 2 * noise, rtol=1e-5)
+
+        # recomputed for new difference kernels
+        observation.match(model_frame)
+        assert get_wavelet_noise(observation) is not noise_
+        assert_allclose(get_wavelet_noise(observation), noise_, rtol=1e-5)
+
+    def test_sed_coadd_negative(self):
+        observation, model_frame = self.get_observation()
+        bg_rms = np.ones(2)
+        with pytest.raises(ValueError):
+            build_sed_coadd(np.array([0, -1.0]), bg_rms, observation)
+
+    def test_sed_coadd_skip_interpolation(self, monkeypatch):
+        # LowResObservations without positive channels do not contribute
+        def interpolate_observation(*args, **kwargs):
+            raise AssertionError("interpolation should be skipped")
+
+        monkeypatch.setattr(
+            scarlet.initialization, "interpolate_observation", interpolate_observation
+        )
+        observation, model_frame = self.get_observation()
+        observations = [observation, self.get_lowres_observation()]
+        seds = [np.ones(2), np.array([0, -1.0])]
+        bg_rmses = [np.ones(2)] * 2
+        detect, bg_cutoff = build_sed_coadd(seds, bg_rmses, observations)
+
+        detect_, bg_cutoff_ = build_sed_coadd(seds[0], bg_rmses[0], observation)
+        assert_allclose(detect, detect_)
+        assert bg_cutoff == bg_cutoff_
@@ -0,0 +1,149 @@
+import pickle
+import numpy as np
+from numpy.testing import assert_array_equal, assert_allclose
+from autograd import grad
+
+import scarlet
+
+
+class TestParameter:
+    def test_arithmetic(self):
+        x = np.arange(6, dtype="float").reshape(2, 3)
+        p = scarlet.Parameter(x.copy(), name="p", step=0.1)
+
+        # derived quantities are plain arrays
+        y = 2 * p + 1
+        assert type(y) is np.ndarray
+        assert_array_equal(y, 2 * x + 1)
+        assert type(p.sum()) is not scarlet.Parameter
+
+        # views keep the metadata
+        assert isinstance(p[0], scarlet.Parameter)
+        assert p[0].name == "p"
+        assert p[0].step == 0.1
+
+        # in-place operations modify the Parameter itself
+        q = p
+        p *= 2
+        assert p is q
+        assert isinstance(p, scarlet.Parameter)
+        assert_array_equal(p, 2 * x)
+        p[:] -= 1
+        assert_array_equal(p, 2 * x - 1)
+
+        # partial outputs keep the ones allocated by numpy
+        q, r = np.divmod(p, 3, out=(p, None))
+        assert q is p
+        assert type(r) is np.ndarray
+        assert_array_equal(r, (2 * x - 1) % 3)
+        assert_array_equal(p, (2 * x - 1) // 3)
+
+    def test_grad(self):
+        x = np.arange(3, dtype="float")
+        p = scarlet.Parameter(x.copy(), name="p")
+        f = lambda p: (p ** 2).sum()
+        assert_array_equal(grad(f)(p), 2 * x)
+
+    def test_pickle(self):
+        x = np.arange(3, dtype="float")
+        constraint = scarlet.PositivityConstraint()
+        p = scarlet.Parameter(x, name="p", step=0.1, constraint=constraint, fixed=True)
+        assert not hasattr(p, "__dict__")
+
+        p_ = pickle.loads(pickle.dumps(p))
+        assert_array_equal(p_, p)
+        for k in scarlet.Parameter.__slots__:
+            if k not in ["constraint", "_data_cache"]:
+                assert getattr(p_, k) == getattr(p, k)
+        assert isinstance(p_.constraint, scarlet.PositivityConstraint)
+
+    def test_init(self):
+        # no copy for arrays
+        x = np.arange(3, dtype="float")
+        p = scarlet.Parameter(x, name="p")
+        assert np.shares_memory(p, x)
+        assert p.dtype == x.dtype
+
+        # array-likes are converted
+        p = scarlet.Parameter([1.0, 2.0], name="p")
+        assert isinstance(p, scarlet.Parameter)
+        assert_array_equal(p, [1, 2])
+
+    def test_relative_step(self):
+        x = np.arange(6, dtype="float").reshape(2, 3)
+        p = scarlet.Parameter(x, name="p")
+        assert scarlet.relative_step(p, 0) == 0.1 * x.mean()
+        assert_array_equal(
+            scarlet.relative_step(p, 0, factor=0.5, axis=0), 0.5 * x.mean(axis=0)
+        )
+
+        # integer parameters have float steps
+        p = scarlet.Parameter(np.arange(6).reshape(2, 3), name="p")
+        assert_allclose(scarlet.relative_step(p, 0, axis=0), [0.15, 0.25, 0.35])
+
+        # half precision accumulates in single precision
+        x = np.full((4096, 2), 1.1, dtype="float16")
+        p = scarlet.Parameter(x, name="p")
+        step = scarlet.relative_step(p, 0, axis=0)
+        assert step.dtype == x.dtype
+        assert_allclose(step, 0.1 * x.mean(axis=0), rtol=1e-3)
+
+    def test_unpickle_dict_state(self):
+        # state layout of Parameters pickled before the introduction of __slots__
+        x = np.arange(3, dtype="float")
+        p = scarlet.Parameter(x, name="p", step=0.1)
+        reconstruct, args, state = p.__reduce__()
+        meta = dict(zip(scarlet.Parameter.__slots__, state[-1]))
+
+        p_ = reconstruct(*args)
+        p_.__setstate__(state[:-1] + (meta,))
+        assert_array_equal(p_, p)
+        assert p_.name == "p"
+        assert p_.step == 0.1
+
+    def test_view_metadata(self):
+        x = np.arange(6, dtype="float").reshape(2, 3)
+        p = scarlet.Parameter(x, name="p", step=scarlet.relative_step, fixed=True)
+        for view in (p[1], p.reshape(-1), p.T):
+            assert view.name == "p"
+            assert view.step is scarlet.relative_step
+            assert view.fixed
+
+        p = x.view(scarlet.Parameter)
+        assert p.name == "unnamed"
+        assert p.step == 0
+        assert not p.fixed
+
+    def test_data(self):
+        x = np.arange(6, dtype="float").reshape(2, 3)
+        p = scarlet.Parameter(x, name="p")
+        assert type(p._data) is np.ndarray
+        assert p._data is p._data
+        assert np.shares_memory(p._data, p)
+
+        # views and copies have their own
+        for p_ in (p[1], p.copy(), pickle.loads(pickle.dumps(p))):
+            assert p_._data.shape == p_.shape
+            assert np.shares_memory(p_._data, p_)
+
+        p._data[0, 0] = -1
+        assert p[0, 0] == -1
+
+    def test_step_dtype(self):
+        x = np.arange(6, dtype="float32").reshape(2, 3)
+        p = scarlet.Parameter(x, name="p", step=1e-2)
+        assert p.step.dtype == x.dtype
+        p = scarlet.Parameter(x, name="p", step=np.ones(3))
+        assert p.step.dtype == x.dtype
+        p = scarlet.Parameter(x, name="p", step=scarlet.relative_step)
+        assert p.step is scarlet.relative_step
+        assert scarlet.relative_step(p, 0).dtype == x.dtype
+        assert scarlet.relative_step(p, 0, axis=0).dtype == x.dtype
+
+        # only numbers are converted
+        p = scarlet.Parameter(x, name="p", step=None)
+        assert p.step is None
+
+        # integer parameters keep float steps
+        p = scarlet.Parameter(np.arange(6).reshape(2, 3), name="p")
+        assert np.isclose(scarlet.relative_step(p, 0), 0.25)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+import scarlet
+
+
+class TestPSF(object):
+    def get_image(self, shape=(2, 5, 5)):
+        image = np.ones(shape)
+        image[:, shape[1] // 2, shape[2] // 2] = np.arange(2, shape[0] + 2)
+        return image
+
+    def test_peaks_fixed(self):
+        psf = scarlet.ImagePSF(self.get_image())
+        peaks = psf.peaks
+        assert_array_equal(peaks, psf.get_model().max(axis=(1, 2)))
+
+        # cached and protected against changes
+        assert psf.peaks is peaks
+        with pytest.raises(ValueError):
+            peaks[0] = 0
+
+    def test_peaks_free(self):
+        image = scarlet.Parameter(self.get_image(), name="image", fixed=False)
+        psf = scarlet.ImagePSF(image)
+        peaks = psf.peaks
+        assert_array_equal(peaks, psf.get_model().max(axis=(1, 2)))
+
+        # evaluated from the current parameters
+        image *= 2
+        assert psf.peaks is not peaks
+        assert_array_equal(psf.peaks, 2 * peaks)
@@ -0,0 +1,34 @@
+import numpy as np
+from numpy.testing import assert_array_equal, assert_allclose
+
+import scarlet
+
+
+class TestRandomSource(object):
+    def get_frame(self, dtype=np.float32, shape=(3, 11, 13)):
+        channels = ["c{}".format(c) for c in range(shape[0])]
+        return scarlet.Frame(shape, channels=channels, dtype=dtype)
+
+    def test_rng(self):
+        for dtype in (np.float32, np.float64, np.float16):
+            frame = self.get_frame(dtype=dtype)
+            src = scarlet.RandomSource(frame, rng=np.random.default_rng(1))
+            src_ = scarlet.RandomSource(frame, rng=np.random.default_rng(1))
+
+            model = src.get_model()
+            assert model.shape == frame.shape
+            for p, p_ in zip(src.parameters, src_.parameters):
+                assert p.dtype == dtype
+                assert_array_equal(p, p_)
+
+    def test_observation(self):
+        frame = self.get_frame()
+        images = np.random.RandomState(0).rand(*frame.shape).astype(frame.dtype)
+        observation = scarlet.Observation(images, channels=frame.channels)
+        src = scarlet.RandomSource(
+            frame, observations=observation, rng=np.random.default_rng(1)
+        )
+        spectrum, image = src.parameters
+        # least-squares spectrum for the random morphology
+        expected = (images * image).sum(axis=(1, 2)) / (image ** 2).sum()
+        assert_allclose(spectrum, expected, rtol=1e-5)